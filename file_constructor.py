@@ -1,82 +1,128 @@
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
+try:
+    import orjson  # 3-10x faster C JSON parser; falls back to stdlib
+except ImportError:
+    orjson = None
+
 
 class IncrementalFileReconstructor:
     """
     Reconstructs full file content from incremental commit storage
     """
     
+    # Reconstructed (owner, repo, sha, filename) -> content entries kept
+    # so sibling queries reuse earlier parent-chain walks
+    CONTENT_CACHE_MAX = 1024
+
     def __init__(self, data_dir='commit_history'):
         self.data_dir = Path(data_dir)
+        self._content_cache = OrderedDict()
     
     def load_commit(self, owner: str, repo_name: str, sha: str) -> Optional[Dict]:
-        """Load a specific commit by SHA"""
+        """
+        Load a specific commit by SHA
+        Parses are cached — a commit file is immutable once written — but
+        misses are not, so a SHA ingested after the first query is still
+        picked up by a long-lived reconstructor
+        """
         repo_dir = self.data_dir / f"{owner}_{repo_name}"
         commit_file = repo_dir / f"{sha}.json"
-        
+
         if not commit_file.exists():
             return None
-        
-        return json.loads(commit_file.read_text())
+
+        return self._parse_commit_file(commit_file)
+
+    @lru_cache(maxsize=2048)
+    def _parse_commit_file(self, commit_file: Path) -> Dict:
+        # read_bytes + orjson skips the UTF-8 decode/re-encode round-trip
+        data = commit_file.read_bytes()
+        return orjson.loads(data) if orjson else json.loads(data)
     
-    def get_file_at_commit(self, owner: str, repo_name: str, 
+    def get_file_at_commit(self, owner: str, repo_name: str,
                           commit_sha: str, filename: str) -> Optional[str]:
         """
         Reconstruct full file content at a specific commit
-        Follows parent chain if needed for incremental updates
+        Walks the parent chain iteratively (deep histories would blow the
+        recursion limit) and memoizes every commit visited on the way
         """
-        commit = self.load_commit(owner, repo_name, commit_sha)
-        if not commit:
-            return None
-        
-        # Find the file in this commit
-        for file_diff in commit.get('files', []):
-            if file_diff['filename'] == filename:
-                storage_type = file_diff.get('storage_type', 'unknown')
-                
-                # If we have full content stored, return it
-                if file_diff.get('after_code'):
-                    return file_diff['after_code']
-                
-                # If it's an incremental update, get from parent
-                if storage_type == 'incremental_update' and file_diff.get('before_reference'):
-                    parent_sha = file_diff['before_reference']
-                    parent_content = self.get_file_at_commit(owner, repo_name, parent_sha, filename)
-                    
-                    # Apply patch to parent content
-                    if parent_content and file_diff.get('patch'):
-                        # Note: Full patch application requires patch parsing library
-                        # For now, just return parent content
-                        # In production, use 'patch' library or similar
-                        return parent_content
-                    
-                    return parent_content
-                
-                # If patch_only or patch_new, reconstruct from patch
-                if file_diff.get('patch'):
-                    # For added files with patch, extract from patch
-                    if storage_type == 'patch_new':
-                        return self._extract_content_from_patch(file_diff['patch'])
-                    
-                    # For modifications, need parent content + patch
-                    if storage_type == 'patch_only':
-                        parent_sha = commit.get('parent_sha')
-                        if parent_sha:
-                            parent_content = self.get_file_at_commit(owner, repo_name, parent_sha, filename)
-                            if parent_content:
-                                # Apply patch (simplified - real implementation needs patch library)
-                                return parent_content
-                
-                return None
-        
-        # File not in this commit, check parent
-        parent_sha = commit.get('parent_sha')
-        if parent_sha:
-            return self.get_file_at_commit(owner, repo_name, parent_sha, filename)
-        
-        return None
+        cache = self._content_cache
+        visited = []
+        content = None
+        resolved = True
+        sha = commit_sha
+
+        while sha:
+            key = (owner, repo_name, sha, filename)
+            if key in cache:
+                cache.move_to_end(key)
+                content = cache[key]
+                break
+            visited.append(key)
+
+            commit = self.load_commit(owner, repo_name, sha)
+            if not commit:
+                # Ancestor not ingested yet — the answer may change once it
+                # arrives, so this walk must not be memoized
+                resolved = False
+                break
+
+            # Find the file in this commit
+            file_diff = None
+            for fd in commit.get('files', []):
+                if fd['filename'] == filename:
+                    file_diff = fd
+                    break
+
+            # File not in this commit, check parent
+            if file_diff is None:
+                sha = commit.get('parent_sha')
+                continue
+
+            storage_type = file_diff.get('storage_type', 'unknown')
+
+            # If we have full content stored, return it
+            if file_diff.get('after_code'):
+                content = file_diff['after_code']
+                break
+
+            # If it's an incremental update, get from parent
+            # Note: Full patch application requires patch parsing library
+            # For now, the parent content stands in for the patched result
+            if storage_type == 'incremental_update' and file_diff.get('before_reference'):
+                sha = file_diff['before_reference']
+                continue
+
+            # If patch_only or patch_new, reconstruct from patch
+            if file_diff.get('patch'):
+                # For added files with patch, extract from patch
+                if storage_type == 'patch_new':
+                    content = self._extract_content_from_patch(file_diff['patch'])
+                    break
+
+                # For modifications, need parent content + patch
+                # (simplified - real implementation needs patch library)
+                if storage_type == 'patch_only':
+                    sha = commit.get('parent_sha')
+                    continue
+
+            break
+
+        # Every commit walked through resolves to the same content, so
+        # memoize them all for later queries — unless the walk dead-ended
+        # on a commit that hasn't been ingested yet
+        if resolved:
+            for key in visited:
+                cache[key] = content
+            while len(cache) > self.CONTENT_CACHE_MAX:
+                cache.popitem(last=False)
+
+        return content
     
     def _extract_content_from_patch(self, patch: str) -> str:
         """
@@ -1,7 +1,53 @@
 import requests
-from typing import Dict, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
 import os
 import base64
+import asyncio
+import json
+import re
+from collections import Counter, OrderedDict
+
+try:
+    import aiohttp  # optional: enables concurrent commit analysis
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # 3-10x faster C JSON parser; falls back to stdlib
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    """Parse JSON straight from response bytes (no .text decode pass)"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# Max in-flight GitHub requests on the async path (rate-limit friendly)
+ASYNC_CONCURRENCY = 8
+
+# Filename classification tables, built once — exact basename membership
+# is O(1) and stricter than the old substring scans ('mypackage.json' no
+# longer counts as a dependency file)
+_DEP_BASENAMES = frozenset({
+    'package.json', 'requirements.txt', 'pom.xml', 'build.gradle',
+    'gemfile', 'cargo.toml', 'go.mod', 'composer.json',
+    'package-lock.json', 'yarn.lock'
+})
+
+_CFG_BASENAMES = frozenset({
+    '.env', 'config.json', 'config.yaml', 'settings.py',
+    'webpack.config.js', 'tsconfig.json', '.gitignore'
+})
+
+_DOC_RE  = re.compile(r'readme|\.md$')
+_TEST_RE = re.compile(r'test|spec')
+
+# Commit-message keyword stems; the leading \b rejects mid-word hits
+# while \w* keeps the inflected forms ("fixes", "bugfix", "added")
+_BUGFIX_RE  = re.compile(r'\b(?:fix\w*|bug\w*|patch\w*)', re.I)
+_FEATURE_RE = re.compile(r'\b(?:feat\w*|add\w*)', re.I)
 
 
 class GitHubMonitor:
@@ -16,27 +62,142 @@ class GitHubMonitor:
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
 
+        # One long-lived session: keep-alive + TLS reuse across the many
+        # API calls a single commit analysis makes, with a connection pool
+        # sized for parallel fetches and retries on GitHub's transient errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Commit JSON is immutable per SHA; only successful responses are
+        # kept so a transient failure can still be retried
+        self._commit_details_cache = OrderedDict()
+
+        # (owner, repo, path, ref) -> text for blob lookups; stores 200
+        # bodies and known 404s, never auth/rate-limit errors
+        self._file_content_cache = OrderedDict()
+
+        # (url, accept) -> (etag, body) for conditional requests
+        self._etag_cache = OrderedDict()
+
+    def close(self):
+        """Release the pooled connections"""
+        self.session.close()
+
     # ------------------- GitHub API helpers -------------------
 
+    COMMIT_CACHE_MAX = 512
+    ETAG_CACHE_MAX = 1024
+
+    def _etag_get(self, url: str, accept: str = None) -> Tuple[int, bytes]:
+        """
+        GET with If-None-Match when an ETag is known. A 304 still costs a
+        rate-limit token but carries no body and returns much faster;
+        repeat fetches (webhook retries, reruns) resolve from the cache.
+        Returns (status_code, body bytes) with 304s already resolved.
+        """
+        key = (url, accept or '')
+        headers = self._etag_request_headers(key, accept)
+        r = self.session.get(url, timeout=15, headers=headers or None)
+        return self._etag_resolve(key, r.status_code, r.headers.get('ETag'), r.content)
+
+    def _etag_request_headers(self, key: Tuple, accept: str) -> Dict:
+        """Request headers for a conditional GET, If-None-Match included"""
+        headers = {'Accept': accept} if accept else {}
+        cached = self._etag_cache.get(key)
+        if cached:
+            self._etag_cache.move_to_end(key)
+            headers['If-None-Match'] = cached[0]
+        return headers
+
+    def _etag_resolve(self, key: Tuple, status: int, etag: str,
+                      body: bytes) -> Tuple[int, bytes]:
+        """Resolve a 304 from the cache / store a fresh 200 body"""
+        cache = self._etag_cache
+        cached = cache.get(key)
+        if status == 304 and cached:
+            return 200, cached[1]
+
+        if status == 200 and etag:
+            cache[key] = (etag, body)
+            while len(cache) > self.ETAG_CACHE_MAX:
+                cache.popitem(last=False)
+
+        return status, body
+
     def get_commit_details(self, owner: str, repo: str, sha: str) -> Dict:
-        url = f'https://api.github.com/repos/{owner}/{repo}/commits/{sha}'
-        r = requests.get(url, headers=self.headers, timeout=15)
-        return r.json() if r.status_code == 200 else {}
+        key = (owner, repo, sha)
+        cache = self._commit_details_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        # per_page=300 returns the files array complete in one response for
+        # wide commits instead of forcing a second paginated request
+        url = f'https://api.github.com/repos/{owner}/{repo}/commits/{sha}?per_page=300'
+        status, body = self._etag_get(url)
+        if status != 200:
+            return {}
+
+        data = _loads(body)
+        cache[key] = data
+        while len(cache) > self.COMMIT_CACHE_MAX:
+            cache.popitem(last=False)
+        return data
+
+    FILE_CACHE_MAX = 2048
 
     def get_file_content(self, owner: str, repo: str, path: str, ref: str) -> str:
         """
         Fetch file content at specific commit (before/after)
+        Cached: content at a fixed ref is immutable, and webhook retries,
+        parent lookups and rename pairs re-request the same blobs. Known
+        404s cache as "" so missing paths aren't re-fetched, but auth and
+        rate-limit errors (401/403) stay uncached so they can be retried.
         """
+        key = (owner, repo, path, ref)
+        cache = self._file_content_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={ref}"
-        r = requests.get(url, headers=self.headers, timeout=15)
 
-        if r.status_code == 200:
-            content = r.json().get('content', '')
-            try:
-                return base64.b64decode(content).decode('utf-8', errors='ignore')
-            except:
-                return ""
-        return ""
+        # Raw media type: no JSON envelope to parse, no base64 to decode
+        status, body = self._etag_get(url, accept='application/vnd.github.raw')
+        if status == 415:
+            # Fallback to the base64 envelope if raw is rejected
+            status, body = self._etag_get(url)
+            text = ""
+            if status == 200:
+                content = _loads(body).get('content', '')
+                try:
+                    text = base64.b64decode(content).decode('utf-8', errors='ignore')
+                except:
+                    text = ""
+        else:
+            text = body.decode('utf-8', errors='ignore') if status == 200 else ""
+
+        return self._file_cache_store(key, status, text)
+
+    def _file_cache_store(self, key: Tuple, status: int, text: str) -> str:
+        """Cache definitive blob results (200 and 404) only"""
+        if status in (200, 404):
+            cache = self._file_content_cache
+            cache[key] = text
+            while len(cache) > self.FILE_CACHE_MAX:
+                cache.popitem(last=False)
+        return text
 
     # ------------------- Webhook creation -------------------
 
@@ -54,81 +215,230 @@ class GitHubMonitor:
             }
         }
 
-        requests.post(url, json=payload, headers=self.headers)
+        self.session.post(url, json=payload)
 
     # ------------------- MAIN ANALYZER -------------------
 
-    def analyze_commit(self, owner: str, repo: str, sha: str) -> Tuple[Dict, List[Dict], str]:
+    def analyze_commit(self, owner: str, repo: str, sha: str,
+                       fetch_full: bool = True) -> Tuple[Dict, List[Dict], str]:
+        """
+        Classification only reads patches, counts and filenames; pass
+        fetch_full=False to skip every before/after content round-trip
+        when the caller doesn't need full file bodies
+        """
+        # With aiohttp installed (and no loop already running) the sync API
+        # is just a front for the concurrent path
+        if aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.analyze_commit_async(
+                    owner, repo, sha, fetch_full=fetch_full
+                ))
+
         commit = self.get_commit_details(owner, repo, sha)
         if not commit:
             return {}, [], None
 
         files = commit.get('files', [])
-        stats = commit.get('stats', {})
-        message = commit.get('commit', {}).get('message', '')
-
         parent_sha = None
         if commit.get('parents'):
             parent_sha = commit['parents'][0]['sha']
 
-        # -------- Smart file diff collection (patch-first strategy) --------
+        file_diffs, fetch_jobs = self._plan_file_diffs(files, sha, parent_sha)
+
+        if fetch_full:
+            # One GraphQL round-trip covers every needed blob; REST only for
+            # pairs GraphQL couldn't serve (binary, >512KB text, no token)
+            blob_texts = self._fetch_blobs_graphql(owner, repo, fetch_jobs)
+            for idx, field, path, ref in fetch_jobs:
+                content = blob_texts.get((ref, path))
+                if content is None:
+                    content = self.get_file_content(owner, repo, path, ref)
+                file_diffs[idx][field] = content
+        self._annotate_line_counts(file_diffs)
+
+        event = self._build_event(commit, files)
+        return event, file_diffs, parent_sha
+
+    def _fetch_blobs_graphql(self, owner: str, repo: str,
+                             fetch_jobs: List[Tuple]) -> Dict:
+        """
+        Fetch all (ref, path) blobs needed by a commit in one GraphQL query,
+        aliasing each as bN: object(expression: "ref:path") { ... on Blob }.
+        Returns {(ref, path): text}; pairs that came back missing or binary
+        are omitted so the caller can fall back to the contents API.
+        """
+        if not self.token or not fetch_jobs:
+            return {}
+
+        pairs, query = self._build_blob_query(fetch_jobs)
+
+        try:
+            r = self.session.post(
+                'https://api.github.com/graphql',
+                json={'query': query, 'variables': {'owner': owner, 'name': repo}},
+                timeout=15,
+            )
+            if r.status_code != 200:
+                return {}
+            repo_data = (_loads(r.content).get('data') or {}).get('repository') or {}
+        except requests.RequestException:
+            return {}
+
+        return self._map_blob_results(pairs, repo_data)
+
+    @staticmethod
+    def _build_blob_query(fetch_jobs: List[Tuple]) -> Tuple[List[Tuple], str]:
+        """Dedupe (ref, path) pairs and build the aliased blob query"""
+        pairs = []
+        for _idx, _field, path, ref in fetch_jobs:
+            if (ref, path) not in pairs:
+                pairs.append((ref, path))
+
+        parts = []
+        for i, (ref, path) in enumerate(pairs):
+            expr = json.dumps(f'{ref}:{path}')
+            parts.append(
+                f'b{i}: object(expression: {expr}) '
+                '{ ... on Blob { text isBinary } }'
+            )
+        query = (
+            'query($owner: String!, $name: String!) { '
+            'repository(owner: $owner, name: $name) { '
+            + ' '.join(parts) + ' } }'
+        )
+        return pairs, query
+
+    @staticmethod
+    def _map_blob_results(pairs: List[Tuple], repo_data: Dict) -> Dict:
+        """Map aliased blob results back to their (ref, path) pairs"""
+        contents = {}
+        for i, pair in enumerate(pairs):
+            blob = repo_data.get(f'b{i}')
+            if blob and not blob.get('isBinary') and blob.get('text') is not None:
+                contents[pair] = blob['text']
+        return contents
+
+    @staticmethod
+    def _annotate_line_counts(file_diffs: List[Dict]):
+        """
+        Store line counts once at ingest so report generation never has to
+        splitlines() the full file bodies again
+        """
+        for fd in file_diffs:
+            fd['lines_before'] = GitHubMonitor._line_count(fd.get('before_code'))
+            fd['lines_after'] = GitHubMonitor._line_count(fd.get('after_code'))
+
+    @staticmethod
+    def _line_count(content: Optional[str]) -> int:
+        """len(content.splitlines()) without materializing the line list"""
+        if not content:
+            return 0
+        # A trailing newline terminates the last line rather than opening
+        # a new one, matching splitlines()
+        return content.count('\n') + (0 if content.endswith('\n') else 1)
+
+    # 'before' SHA GitHub sends for new branches and forced rewrites
+    ZERO_SHA = '0' * 40
+
+    def analyze_push(self, owner: str, repo: str, before: str,
+                     after: str) -> Tuple[Dict, List[Dict], List[str]]:
+        """
+        Analyze a whole push with one /compare/{before}...{after} call
+        instead of one /commits/{sha} round-trip per commit. Returns the
+        aggregate (event, file_diffs, commit_shas) for the push; diffs stay
+        patch-level (no full-content fetches). Pushes that can't be
+        compared — new branch or forced rewrite — return empty so callers
+        fall back to per-commit analyze_commit."""
+        if not before or before == self.ZERO_SHA:
+            return {}, [], []
+
+        url = (f'https://api.github.com/repos/{owner}/{repo}/'
+               f'compare/{before}...{after}')
+        status, body = self._etag_get(url)
+        if status != 200:
+            return {}, [], []
+
+        data = _loads(body)
+        files = data.get('files', [])
+        commits = data.get('commits', [])
+        shas = [c['sha'] for c in commits]
+        message = commits[-1].get('commit', {}).get('message', '') if commits else ''
+
+        file_diffs, _ = self._plan_file_diffs(files, after, before)
+        self._annotate_line_counts(file_diffs)
+
+        # The compare payload has no aggregate stats block; sum the files
+        synthetic = {
+            'stats': {
+                'additions': sum(f.get('additions', 0) for f in files),
+                'deletions': sum(f.get('deletions', 0) for f in files),
+            },
+            'commit': {'message': message},
+        }
+        event = self._build_event(synthetic, files)
+        return event, file_diffs, shas
+
+    def _plan_file_diffs(self, files: List[Dict], sha: str,
+                         parent_sha: str) -> Tuple[List[Dict], List[Tuple]]:
+        """
+        Smart file diff collection (patch-first strategy)
+        Builds diff skeletons plus the list of full-content fetches needed,
+        as (diff index, 'before_code'/'after_code', path, ref) tuples
+        """
         file_diffs = []
+        fetch_jobs = []
 
-        for f in files:
+        for idx, f in enumerate(files):
             path = f['filename']
             status = f['status']
             patch = f.get('patch', '')
-            additions = f.get('additions', 0)
-            deletions = f.get('deletions', 0)
-            changes = f.get('changes', 0)
 
             file_diff = {
                 'filename': path,
                 'status': status,
-                'additions': additions,
-                'deletions': deletions,
-                'changes': changes,
-                'patch': patch
+                'additions': f.get('additions', 0),
+                'deletions': f.get('deletions', 0),
+                'changes': f.get('changes', 0),
+                'patch': patch,
+                'before_code': None,
+                'after_code': None
             }
 
             # Decide if we need full file content
-            patch_size = len(patch)
-            needs_full_file = patch_size > 800
+            needs_full_file = len(patch) > 800
 
             if status == 'added':
-                # For new files, patch contains full content if small
+                # For new files, small patches contain the full content
                 if needs_full_file:
-                    file_diff['after_code'] = self.get_file_content(owner, repo, path, sha)
-                else:
-                    file_diff['after_code'] = None  # Patch is enough
-                file_diff['before_code'] = None
+                    fetch_jobs.append((idx, 'after_code', path, sha))
 
             elif status == 'removed':
                 # Deleted files - don't fetch anything
-                file_diff['before_code'] = None
-                file_diff['after_code'] = None
+                pass
 
             elif status == 'modified':
                 # Only fetch full files for large patches
                 if needs_full_file:
-                    file_diff['before_code'] = self.get_file_content(owner, repo, path, parent_sha) if parent_sha else None
-                    file_diff['after_code'] = self.get_file_content(owner, repo, path, sha)
-                else:
-                    file_diff['before_code'] = None
-                    file_diff['after_code'] = None
+                    if parent_sha:
+                        fetch_jobs.append((idx, 'before_code', path, parent_sha))
+                    fetch_jobs.append((idx, 'after_code', path, sha))
 
             elif status == 'renamed':
                 # Renamed files with changes
                 if needs_full_file:
-                    file_diff['after_code'] = self.get_file_content(owner, repo, path, sha)
-                    file_diff['before_code'] = None
-                else:
-                    file_diff['before_code'] = None
-                    file_diff['after_code'] = None
+                    fetch_jobs.append((idx, 'after_code', path, sha))
 
             file_diffs.append(file_diff)
 
-        # -------- Classification --------
+        return file_diffs, fetch_jobs
+
+    def _build_event(self, commit: Dict, files: List[Dict]) -> Dict:
+        """Classify the commit from its file list and stats"""
+        stats = commit.get('stats', {})
+        message = commit.get('commit', {}).get('message', '')
+
         files_changed = len(files)
         additions = stats.get('additions', 0)
         deletions = stats.get('deletions', 0)
@@ -138,7 +448,7 @@ class GitHubMonitor:
             file_analysis, files_changed, additions, deletions, message
         )
 
-        event = {
+        return {
             'type': event_type,
             'description': description,
             'files_changed': files_changed,
@@ -146,8 +456,184 @@ class GitHubMonitor:
             'total_deletions': deletions
         }
 
+    # ------------------- Async variants -------------------
+
+    async def _etag_get_async(self, session, url: str,
+                              accept: str = None) -> Tuple[int, bytes]:
+        """Async twin of _etag_get, sharing the conditional-request cache"""
+        key = (url, accept or '')
+        headers = self._etag_request_headers(key, accept)
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15),
+                               headers=headers or None) as r:
+            body = await r.read()
+            return self._etag_resolve(key, r.status, r.headers.get('ETag'), body)
+
+    async def get_commit_details_async(self, session, owner: str, repo: str, sha: str) -> Dict:
+        key = (owner, repo, sha)
+        cache = self._commit_details_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        # per_page=300 returns the files array complete in one response for
+        # wide commits instead of forcing a second paginated request
+        url = f'https://api.github.com/repos/{owner}/{repo}/commits/{sha}?per_page=300'
+        status, body = await self._etag_get_async(session, url)
+        if status != 200:
+            return {}
+
+        data = _loads(body)
+        cache[key] = data
+        while len(cache) > self.COMMIT_CACHE_MAX:
+            cache.popitem(last=False)
+        return data
+
+    async def get_file_content_async(self, session, owner: str, repo: str,
+                                     path: str, ref: str) -> str:
+        """Async twin of get_file_content, sharing its blob cache"""
+        key = (owner, repo, path, ref)
+        cache = self._file_content_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={ref}"
+
+        # Raw media type: no JSON envelope to parse, no base64 to decode
+        status, body = await self._etag_get_async(
+            session, url, accept='application/vnd.github.raw'
+        )
+        if status == 415:
+            # Fallback to the base64 envelope if raw is rejected
+            status, body = await self._etag_get_async(session, url)
+            text = ""
+            if status == 200:
+                content = _loads(body).get('content', '')
+                try:
+                    text = base64.b64decode(content).decode('utf-8', errors='ignore')
+                except:
+                    text = ""
+        else:
+            text = body.decode('utf-8', errors='ignore') if status == 200 else ""
+
+        return self._file_cache_store(key, status, text)
+
+    async def _fetch_blobs_graphql_async(self, session, owner: str, repo: str,
+                                         fetch_jobs: List[Tuple]) -> Dict:
+        """Async twin of _fetch_blobs_graphql, sharing the query builder"""
+        if not self.token or not fetch_jobs:
+            return {}
+
+        pairs, query = self._build_blob_query(fetch_jobs)
+
+        try:
+            async with session.post(
+                'https://api.github.com/graphql',
+                json={'query': query, 'variables': {'owner': owner, 'name': repo}},
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as r:
+                if r.status != 200:
+                    return {}
+                data = await r.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # ClientTimeout raises asyncio.TimeoutError, not ClientError —
+            # degrade to per-file REST like the sync twin does
+            return {}
+
+        repo_data = (data.get('data') or {}).get('repository') or {}
+        return self._map_blob_results(pairs, repo_data)
+
+    async def analyze_commit_async(self, owner: str, repo: str, sha: str,
+                                   session=None, semaphore=None,
+                                   fetch_full: bool = True) -> Tuple[Dict, List[Dict], str]:
+        """
+        Async analyze_commit, for fanning a whole push out at once:
+            asyncio.gather(*[monitor.analyze_commit_async(o, r, s, session, sem)
+                             for s in shas])
+        Requires aiohttp; pass a shared session/semaphore when batching.
+        """
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for analyze_commit_async")
+
+        if session is None:
+            async with aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=ASYNC_CONCURRENCY),
+            ) as session:
+                return await self.analyze_commit_async(
+                    owner, repo, sha, session, semaphore, fetch_full
+                )
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+
+        async with semaphore:
+            commit = await self.get_commit_details_async(session, owner, repo, sha)
+        if not commit:
+            return {}, [], None
+
+        files = commit.get('files', [])
+        parent_sha = None
+        if commit.get('parents'):
+            parent_sha = commit['parents'][0]['sha']
+
+        file_diffs, fetch_jobs = self._plan_file_diffs(files, sha, parent_sha)
+
+        if fetch_full:
+            # One GraphQL round-trip covers every needed blob; the leftovers
+            # (binary, >512KB text, no token) fan out concurrently over REST
+            async with semaphore:
+                blob_texts = await self._fetch_blobs_graphql_async(
+                    session, owner, repo, fetch_jobs
+                )
+            rest_jobs = []
+            for idx, field, path, ref in fetch_jobs:
+                content = blob_texts.get((ref, path))
+                if content is None:
+                    rest_jobs.append((idx, field, path, ref))
+                else:
+                    file_diffs[idx][field] = content
+
+            async def _fetch(idx, field, path, ref):
+                async with semaphore:
+                    return idx, field, await self.get_file_content_async(
+                        session, owner, repo, path, ref
+                    )
+
+            results = await asyncio.gather(
+                *(_fetch(*job) for job in rest_jobs), return_exceptions=True
+            )
+            for res in results:
+                if isinstance(res, BaseException):
+                    continue
+                idx, field, content = res
+                file_diffs[idx][field] = content
+        self._annotate_line_counts(file_diffs)
+
+        event = self._build_event(commit, files)
         return event, file_diffs, parent_sha
 
+    def analyze_commits(self, owner: str, repo: str, shas: List[str]) -> List[Tuple[Dict, List[Dict], str]]:
+        """
+        Analyze a batch of commits concurrently over one shared session.
+        Falls back to the sequential path when aiohttp is not installed.
+        """
+        if aiohttp is None:
+            return [self.analyze_commit(owner, repo, sha) for sha in shas]
+
+        async def _run():
+            semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+            async with aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=ASYNC_CONCURRENCY),
+            ) as session:
+                return await asyncio.gather(*[
+                    self.analyze_commit_async(owner, repo, sha, session, semaphore)
+                    for sha in shas
+                ])
+
+        return asyncio.run(_run())
+
     # ------------------- Your original smart logic -------------------
 
     def _analyze_files(self, files: List[Dict]) -> Dict:
@@ -164,21 +650,27 @@ class GitHubMonitor:
             'large_changes': 0
         }
 
-        dependency_files = [
-            'package.json', 'requirements.txt', 'pom.xml', 'build.gradle',
-            'Gemfile', 'Cargo.toml', 'go.mod', 'composer.json',
-            'package-lock.json', 'yarn.lock'
-        ]
+        filenames = [f['filename'] for f in files]
+
+        # C-level tallies: Counter counts in one pass, and (r)partition
+        # grabs the suffix/prefix without allocating a full split list
+        analysis['extensions'] = dict(Counter(
+            fn.rpartition('.')[2] for fn in filenames if '.' in fn
+        ))
+        analysis['directories'] = {
+            fn.partition('/')[0] for fn in filenames if '/' in fn
+        }
 
-        config_files = [
-            '.env', 'config.json', 'config.yaml', 'settings.py',
-            'webpack.config.js', 'tsconfig.json', '.gitignore'
-        ]
+        # Flags live in locals and each check is skipped once it has hit —
+        # on a 500-file commit that's hundreds of matches never run (and no
+        # per-file dict writes in the bytecode)
+        has_deps = has_config = has_docs = has_tests = False
 
         for file in files:
             filename = file['filename']
             status = file['status']
             changes = file.get('changes', 0)
+            low = filename.lower()
 
             if status == 'added':
                 analysis['new_files'] += 1
@@ -187,29 +679,27 @@ class GitHubMonitor:
             else:
                 analysis['modified_files'] += 1
 
-            if '.' in filename:
-                ext = filename.split('.')[-1]
-                analysis['extensions'][ext] = analysis['extensions'].get(ext, 0) + 1
+            if not has_deps or not has_config:
+                base = low.rpartition('/')[2]
+                if not has_deps and base in _DEP_BASENAMES:
+                    has_deps = True
+                if not has_config and base in _CFG_BASENAMES:
+                    has_config = True
 
-            if '/' in filename:
-                directory = filename.split('/')[0]
-                analysis['directories'].add(directory)
+            if not has_docs and _DOC_RE.search(low):
+                has_docs = True
 
-            if any(dep in filename.lower() for dep in dependency_files):
-                analysis['has_dependencies'] = True
-
-            if any(cfg in filename.lower() for cfg in config_files):
-                analysis['has_config'] = True
-
-            if 'readme' in filename.lower() or filename.endswith('.md'):
-                analysis['has_docs'] = True
-
-            if 'test' in filename.lower() or 'spec' in filename.lower():
-                analysis['has_tests'] = True
+            if not has_tests and _TEST_RE.search(low):
+                has_tests = True
 
             if changes > 100:
                 analysis['large_changes'] += 1
 
+        analysis['has_dependencies'] = has_deps
+        analysis['has_config'] = has_config
+        analysis['has_docs'] = has_docs
+        analysis['has_tests'] = has_tests
+
         return analysis
 
     def _classify_work(self, analysis: Dict, files_changed: int,
@@ -242,10 +732,10 @@ class GitHubMonitor:
         if analysis['deleted_files'] > 0:
             return ('cleanup', f'{analysis["deleted_files"]} files removed')
 
-        if any(k in message.lower() for k in ['fix', 'bug', 'patch']):
+        if _BUGFIX_RE.search(message):
             return ('bug_fix', f'Bug fix ({files_changed} files)')
 
-        if any(k in message.lower() for k in ['feat', 'feature', 'add']):
+        if _FEATURE_RE.search(message):
             return ('feature', f'Feature implementation ({files_changed} files)')
 
         if files_changed <= 2 and additions < 50:
@@ -41,10 +41,20 @@ SharedMemory fields written
   ast_features                (dict)  ← Tool 6
 """
 
+import hashlib
+import hmac
+import io
 import json
 import os
+import queue
 import re
 import threading
+import time
+
+try:
+    import orjson  # 3-10x faster C JSON encoder; falls back to stdlib
+except ImportError:
+    orjson = None
 
 from crewai import Agent, Crew, LLM, Task
 
@@ -54,6 +64,10 @@ os.environ["OTEL_SDK_DISABLED"]        = "true"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 GROQ_MODEL   = "groq/llama-3.3-70b-versatile"
 
+# Compiled once — re's internal cache is small and these run per LLM reply
+_FENCE_RE    = re.compile(r"```(?:json)?")
+_JSON_OBJ_RE = re.compile(r"\{[\s\S]*\}")
+
 
 class RepositoryAgent:
 
@@ -259,8 +273,8 @@ with EXACTLY these keys:
     # ──────────────────────────────────────────────────────────
 
     def _parse_output(self, raw: str) -> dict:
-        raw   = re.sub(r"```(?:json)?", "", raw).strip()
-        match = re.search(r"\{[\s\S]*\}", raw)
+        raw   = _FENCE_RE.sub("", raw).strip()
+        match = _JSON_OBJ_RE.search(raw)
         if match:
             try:
                 data     = json.loads(match.group())
@@ -353,9 +367,16 @@ with EXACTLY these keys:
 #  Flask REST API  (port 5001)
 # ══════════════════════════════════════════════════════════════
 
-def start_flask_server(memory, port: int = 5001):
+def create_flask_app(memory, port: int = 5001):
     """
-    Starts the RepositoryAgent Flask API in a daemon thread.
+    Builds the RepositoryAgent Flask app (returns None if Flask is missing).
+
+    In production, serve it with a real WSGI server for worker-level
+    concurrency instead of the single-process dev server, e.g. a wsgi.py
+    containing ``app = create_flask_app(memory)`` run as:
+
+        gunicorn --workers=$(nproc) --worker-class=gthread --threads=8 \\
+                 --bind 0.0.0.0:5001 wsgi:app
 
     Endpoints
     ─────────
@@ -381,16 +402,61 @@ def start_flask_server(memory, port: int = 5001):
         _load_repos,
         _load_commit_history,
         _load_commit_by_sha,
-        _verify_signature,
         repository_registration_tool,
         webhook_commit_processor_tool,
         commit_evolution_analyzer_tool,
     )
 
     WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+    # The key schedule is computed once here; .copy() hands each request a
+    # clone of the primed inner state, so per-request work is just hashing
+    # the payload bytes
+    HMAC_TEMPLATE  = hmac.new(WEBHOOK_SECRET.encode(), digestmod=hashlib.sha256)
     flask_app      = Flask("AutoEval360-RepositoryAgent")
     CORS(flask_app)
 
+    # ── Background webhook worker ────────────────────────────
+    # GitHub retries a webhook if we don't answer within ~10s, and
+    # analyze_commit makes one API round-trip per commit. The route only
+    # verifies + enqueues; this worker drains the queue in batches so
+    # large pushes never block the 200 response.
+    WEBHOOK_BATCH_MAX     = 32
+    WEBHOOK_BATCH_TIMEOUT = 0.5  # seconds to wait for more items
+    webhook_queue         = queue.Queue()
+
+    def _webhook_worker():
+        while True:
+            batch    = [webhook_queue.get()]
+            deadline = time.monotonic() + WEBHOOK_BATCH_TIMEOUT
+            while len(batch) < WEBHOOK_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(webhook_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            for owner, repo_name, commits in batch:
+                try:
+                    result = json.loads(webhook_commit_processor_tool.run(json.dumps({
+                        "owner": owner, "repo_name": repo_name, "commits": commits,
+                    })))
+                    memory.log(
+                        "RepositoryAgent-Webhook",
+                        f"Processed {result.get('processed_count', 0)} commits "
+                        f"for {owner}/{repo_name}",
+                    )
+                except Exception as e:
+                    memory.log(
+                        "RepositoryAgent-Webhook",
+                        f"Failed processing push for {owner}/{repo_name}: {e}",
+                    )
+                finally:
+                    webhook_queue.task_done()
+
+    threading.Thread(target=_webhook_worker, daemon=True).start()
+
     # ── /api/health ─────────────────────────────────────────
     @flask_app.route("/api/health")
     def health():
@@ -436,13 +502,32 @@ def start_flask_server(memory, port: int = 5001):
     # ── /webhook  (GitHub push) ──────────────────────────────
     @flask_app.route("/webhook", methods=["POST"])
     def github_webhook():
-        raw_body  = request.get_data()
+        # Stream the body in 64 KB chunks: the HMAC is fed incrementally
+        # while the chunks are teed into one buffer, instead of
+        # materializing the (possibly MB-scale) payload twice via
+        # get_data() + get_json().
         signature = request.headers.get("X-Hub-Signature-256", "")
+        if WEBHOOK_SECRET and not signature:
+            return "", 401
+
+        mac = HMAC_TEMPLATE.copy()
+        buf = io.BytesIO()
+        while chunk := request.stream.read(64 * 1024):
+            mac.update(chunk)
+            buf.write(chunk)
+        raw_body = buf.getvalue()
+
         if WEBHOOK_SECRET:
-            if not signature or not _verify_signature(raw_body, signature, WEBHOOK_SECRET):
+            expected = "sha256=" + mac.hexdigest()
+            if not hmac.compare_digest(expected, signature):
                 return "", 401
 
-        payload    = request.get_json(silent=True)
+        # One parse of the already-buffered bytes; orjson is ~3x faster
+        # than stdlib on the multi-MB payloads big pushes produce
+        try:
+            payload = orjson.loads(raw_body) if orjson else json.loads(raw_body)
+        except ValueError:
+            payload = None
         event_type = request.headers.get("X-GitHub-Event")
         if not payload or event_type != "push":
             return "", 200
@@ -454,14 +539,8 @@ def start_flask_server(memory, port: int = 5001):
         owner, repo_name = full_name.split("/")
         commits          = payload.get("commits", [])
 
-        # FIX: use .run() — Tool objects are not directly callable in CrewAI >= 0.80
-        result = json.loads(webhook_commit_processor_tool.run(json.dumps({
-            "owner": owner, "repo_name": repo_name, "commits": commits,
-        })))
-        memory.log(
-            "RepositoryAgent-Webhook",
-            f"Processed {result.get('processed_count', 0)} commits for {owner}/{repo_name}",
-        )
+        # Hand off to the background worker — GitHub only needs the 200.
+        webhook_queue.put((owner, repo_name, commits))
         return "", 200
 
     # ── /api/events/<owner>/<repo_name> ─────────────────────
@@ -506,7 +585,13 @@ def start_flask_server(memory, port: int = 5001):
                     "owner":           owner,
                 })
         all_events.sort(key=lambda x: x["timestamp"], reverse=True)
-        return jsonify(all_events[:100])
+        page = all_events[:100]
+        # Largest response in the API — skip jsonify's stdlib encoder
+        if orjson is not None:
+            return flask_app.response_class(
+                orjson.dumps(page), mimetype="application/json"
+            )
+        return jsonify(page)
 
     # ── /api/evolution/<owner>/<repo_name>  (Tool 3) ────────
     @flask_app.route("/api/evolution/<owner>/<repo_name>")
@@ -580,7 +665,19 @@ def start_flask_server(memory, port: int = 5001):
             "mapping_stats":       csr.get("mapping_stats",            {}),
         })
 
-    # ── Start server ─────────────────────────────────────────
+    return flask_app
+
+
+def start_flask_server(memory, port: int = 5001):
+    """
+    Starts the RepositoryAgent Flask API in a daemon thread.
+    Dev convenience wrapper around create_flask_app — use a WSGI server
+    (see create_flask_app docstring) for real deployments.
+    """
+    flask_app = create_flask_app(memory, port)
+    if flask_app is None:
+        return
+
     print(f"\nAutoEval360 RepositoryAgent API → http://localhost:{port}")
     print(f"  Endpoints:")
     print(f"    GET  /api/health")
@@ -594,7 +691,9 @@ def start_flask_server(memory, port: int = 5001):
     print(f"    POST /webhook")
 
     t = threading.Thread(
-        target=lambda: flask_app.run(debug=False, port=port, use_reloader=False),
+        target=lambda: flask_app.run(
+            debug=False, port=port, use_reloader=False, threaded=True
+        ),
         daemon=True,
     )
     t.start()